@@ -0,0 +1,60 @@
+//-----------------------------------------------------------------------------
+// File: Arduino.h
+// Last modified: 19/10/2026
+// Host stand-in for the Arduino core, used by the native build only.
+//-----------------------------------------------------------------------------
+#ifndef ARDUINO_H
+#define ARDUINO_H
+#include <cstdint>
+#include <cstddef>
+#include <cstring>
+#include <string>
+#include <sys/types.h>
+
+//-----------------------------------------------------------------------------
+#define LED_BUILTIN 2
+#define HIGH 0x1
+#define LOW 0x0
+#define OUTPUT 0x03
+
+//-----------------------------------------------------------------------------
+class String{
+  public:
+    String(const char *data = "") : str(data ? data : "") {}
+    size_t length() const { return str.length(); }
+    char operator[](size_t index) const { return str[index]; }
+  private:
+    std::string str;
+};
+
+//-----------------------------------------------------------------------------
+// Serial port backed by stdin/stdout
+class HardwareSerial{
+  public:
+    void begin(unsigned long baud);
+    int available();
+    int read();
+    size_t write(uint8_t data);
+    size_t write(const uint8_t *buf, size_t len);
+    void flush();
+    void wait(int timeout_ms);
+    bool closed();
+  private:
+    void fill();
+    uint8_t rx_buffer[4096];
+    size_t rx_head = 0;
+    size_t rx_tail = 0;
+    uint8_t tx_buffer[4096];
+    size_t tx_len = 0;
+};
+extern HardwareSerial Serial;
+
+//-----------------------------------------------------------------------------
+uint32_t millis();
+void pinMode(uint8_t pin, uint8_t mode);
+void digitalWrite(uint8_t pin, uint8_t val);
+
+void setup();
+void loop();
+
+#endif
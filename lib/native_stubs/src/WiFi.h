@@ -0,0 +1,22 @@
+//-----------------------------------------------------------------------------
+// File: WiFi.h
+// Last modified: 19/10/2026
+// Host stand-in for the Arduino WiFi library, used by the native build only.
+//-----------------------------------------------------------------------------
+#ifndef WIFI_H
+#define WIFI_H
+#include <cstdint>
+#include "esp_wifi.h"
+
+//-----------------------------------------------------------------------------
+class WiFiClass{
+  public:
+    bool mode(wifi_mode_t mode);
+    wifi_mode_t getMode();
+    uint8_t *macAddress(uint8_t *mac);
+  private:
+    wifi_mode_t current_mode = WIFI_MODE_NULL;
+};
+extern WiFiClass WiFi;
+
+#endif
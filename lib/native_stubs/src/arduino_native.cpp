@@ -0,0 +1,149 @@
+//-----------------------------------------------------------------------------
+// File: arduino_native.cpp
+// Last modified: 19/10/2026
+// Host implementation of the Arduino core pieces the firmware uses. Serial
+// reads from stdin and writes to stdout so the firmware can be driven over a
+// pipe or a pseudo terminal.
+//-----------------------------------------------------------------------------
+#include <Arduino.h>
+#include <esp_now.h>
+#include <chrono>
+#include <csignal>
+#include <cerrno>
+#include <poll.h>
+#include <unistd.h>
+
+HardwareSerial Serial;
+static bool rx_closed = false;
+
+//-----------------------------------------------------------------------------
+void HardwareSerial::begin(unsigned long baud){
+  (void)baud;
+  signal(SIGPIPE, SIG_IGN);
+}
+
+//-----------------------------------------------------------------------------
+// Read everything stdin has ready into the rx buffer without blocking
+void HardwareSerial::fill(){
+  if(rx_head == rx_tail){
+    rx_head = rx_tail = 0;
+  }
+  if(rx_closed || rx_tail >= sizeof(rx_buffer)){
+    return;
+  }
+  struct pollfd pfd = {STDIN_FILENO, POLLIN, 0};
+  if(poll(&pfd, 1, 0) <= 0){
+    return;
+  }
+  ssize_t n = ::read(STDIN_FILENO, rx_buffer + rx_tail, sizeof(rx_buffer) - rx_tail);
+  if(n > 0){
+    rx_tail += n;
+  }
+  else if(n == 0 || (errno != EINTR && errno != EAGAIN)){
+    // EOF on a pipe, EIO on a pseudo terminal whose other end was closed
+    rx_closed = true;
+  }
+}
+
+//-----------------------------------------------------------------------------
+int HardwareSerial::available(){
+  if(rx_head == rx_tail){
+    fill();
+  }
+  return(rx_tail - rx_head);
+}
+
+//-----------------------------------------------------------------------------
+int HardwareSerial::read(){
+  if(available() == 0){
+    return(-1);
+  }
+  return(rx_buffer[rx_head++]);
+}
+
+//-----------------------------------------------------------------------------
+size_t HardwareSerial::write(uint8_t data){
+  if(tx_len >= sizeof(tx_buffer)){
+    flush();
+  }
+  tx_buffer[tx_len++] = data;
+  return(1);
+}
+
+//-----------------------------------------------------------------------------
+size_t HardwareSerial::write(const uint8_t *buf, size_t len){
+  for(size_t i = 0; i < len; i++){
+    write(buf[i]);
+  }
+  return(len);
+}
+
+//-----------------------------------------------------------------------------
+// Push the tx buffer to stdout, like draining the UART FIFO
+void HardwareSerial::flush(){
+  size_t sent = 0;
+  while(sent < tx_len){
+    ssize_t n = ::write(STDOUT_FILENO, tx_buffer + sent, tx_len - sent);
+    if(n < 0){
+      if(errno == EINTR){
+        continue;
+      }
+      _exit(0);
+    }
+    sent += n;
+  }
+  tx_len = 0;
+}
+
+//-----------------------------------------------------------------------------
+// Sleep until stdin has data or the timeout passes
+void HardwareSerial::wait(int timeout_ms){
+  if(rx_closed){
+    return;
+  }
+  struct pollfd pfd = {STDIN_FILENO, POLLIN, 0};
+  poll(&pfd, 1, timeout_ms);
+}
+
+//-----------------------------------------------------------------------------
+bool HardwareSerial::closed(){
+  return(rx_closed && rx_head == rx_tail);
+}
+
+//-----------------------------------------------------------------------------
+uint32_t millis(){
+  static const auto start = std::chrono::steady_clock::now();
+  auto elapsed = std::chrono::steady_clock::now() - start;
+  return((uint32_t)std::chrono::duration_cast<std::chrono::milliseconds>(elapsed).count());
+}
+
+//-----------------------------------------------------------------------------
+void pinMode(uint8_t pin, uint8_t mode){
+  (void)pin;
+  (void)mode;
+}
+
+//-----------------------------------------------------------------------------
+void digitalWrite(uint8_t pin, uint8_t val){
+  (void)pin;
+  (void)val;
+}
+
+//-----------------------------------------------------------------------------
+// Run the sketch until the host closes stdin
+int main(){
+  setup();
+  while(true){
+    loop();
+    esp_now_native_task();
+    Serial.flush();
+    if(Serial.available() == 0 && !esp_now_native_pending()){
+      if(Serial.closed()){
+        break;
+      }
+      Serial.wait(10);
+    }
+  }
+  Serial.flush();
+  return(0);
+}
@@ -0,0 +1,75 @@
+//-----------------------------------------------------------------------------
+// File: esp_now.h
+// Last modified: 19/10/2026
+// Host stand-in for the ESP-NOW API, used by the native build only.
+//-----------------------------------------------------------------------------
+#ifndef ESP_NOW_H
+#define ESP_NOW_H
+#include <cstdint>
+#include <cstddef>
+#include "esp_wifi.h"
+
+//-----------------------------------------------------------------------------
+#define ESP_ERR_ESPNOW_BASE (ESP_ERR_WIFI_BASE + 100)
+#define ESP_ERR_ESPNOW_NOT_INIT (ESP_ERR_ESPNOW_BASE + 1)
+#define ESP_ERR_ESPNOW_ARG (ESP_ERR_ESPNOW_BASE + 2)
+#define ESP_ERR_ESPNOW_NO_MEM (ESP_ERR_ESPNOW_BASE + 3)
+#define ESP_ERR_ESPNOW_FULL (ESP_ERR_ESPNOW_BASE + 4)
+#define ESP_ERR_ESPNOW_NOT_FOUND (ESP_ERR_ESPNOW_BASE + 5)
+#define ESP_ERR_ESPNOW_INTERNAL (ESP_ERR_ESPNOW_BASE + 6)
+#define ESP_ERR_ESPNOW_EXIST (ESP_ERR_ESPNOW_BASE + 7)
+#define ESP_ERR_ESPNOW_IF (ESP_ERR_ESPNOW_BASE + 8)
+
+#define ESP_NOW_ETH_ALEN 6
+#define ESP_NOW_KEY_LEN 16
+#define ESP_NOW_MAX_TOTAL_PEER_NUM 20
+#define ESP_NOW_MAX_ENCRYPT_PEER_NUM 6
+#define ESP_NOW_MAX_DATA_LEN 250
+
+//-----------------------------------------------------------------------------
+typedef enum{
+    ESP_NOW_SEND_SUCCESS = 0,
+    ESP_NOW_SEND_FAIL,
+} esp_now_send_status_t;
+
+typedef struct{
+    uint8_t peer_addr[ESP_NOW_ETH_ALEN];
+    uint8_t lmk[ESP_NOW_KEY_LEN];
+    uint8_t channel;
+    wifi_interface_t ifidx;
+    bool encrypt;
+    void *priv;
+} esp_now_peer_info_t;
+
+typedef struct{
+    int total_num;
+    int encrypt_num;
+} esp_now_peer_num_t;
+
+typedef void (*esp_now_recv_cb_t)(const uint8_t *mac_addr, const uint8_t *data, int data_len);
+typedef void (*esp_now_send_cb_t)(const uint8_t *mac_addr, esp_now_send_status_t status);
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_init();
+esp_err_t esp_now_deinit();
+esp_err_t esp_now_get_version(uint32_t *version);
+esp_err_t esp_now_register_recv_cb(esp_now_recv_cb_t cb);
+esp_err_t esp_now_unregister_recv_cb();
+esp_err_t esp_now_register_send_cb(esp_now_send_cb_t cb);
+esp_err_t esp_now_unregister_send_cb();
+esp_err_t esp_now_send(const uint8_t *peer_addr, const uint8_t *data, size_t len);
+esp_err_t esp_now_add_peer(const esp_now_peer_info_t *peer);
+esp_err_t esp_now_del_peer(const uint8_t *peer_addr);
+esp_err_t esp_now_mod_peer(const esp_now_peer_info_t *peer);
+esp_err_t esp_now_get_peer(const uint8_t *peer_addr, esp_now_peer_info_t *peer);
+esp_err_t esp_now_fetch_peer(bool from_head, esp_now_peer_info_t *peer);
+bool esp_now_is_peer_exist(const uint8_t *peer_addr);
+esp_err_t esp_now_get_peer_num(esp_now_peer_num_t *num);
+esp_err_t esp_now_set_pmk(const uint8_t *pmk);
+esp_err_t esp_now_set_wake_window(uint16_t window);
+
+// Deliver the callbacks queued by esp_now_send, native build only
+void esp_now_native_task();
+bool esp_now_native_pending();
+
+#endif
@@ -0,0 +1,354 @@
+//-----------------------------------------------------------------------------
+// File: esp_now_native.cpp
+// Last modified: 19/10/2026
+// Host emulation of the ESP-NOW and WiFi calls the firmware uses. Peers are
+// kept in a table with the same limits as ESP-IDF, and every send completes
+// successfully through the send callback on the next loop iteration. Sends
+// addressed to the adapter's own MAC are looped back through the receive
+// callback, so the host can drive the receive path too.
+//-----------------------------------------------------------------------------
+#include <esp_now.h>
+#include <WiFi.h>
+#include <cstring>
+#include <deque>
+
+WiFiClass WiFi;
+
+//-----------------------------------------------------------------------------
+struct pending_send_t{
+  uint8_t mac[ESP_NOW_ETH_ALEN];
+  esp_now_send_status_t status;
+  uint8_t data[ESP_NOW_MAX_DATA_LEN];
+  size_t len;
+};
+
+static const uint8_t native_mac[ESP_NOW_ETH_ALEN] = {0x02, 0x00, 0x00, 0x00, 0x00, 0x01};
+static bool espnow_ready = false;
+static esp_now_recv_cb_t recv_cb = NULL;
+static esp_now_send_cb_t send_cb = NULL;
+static esp_now_peer_info_t peers[ESP_NOW_MAX_TOTAL_PEER_NUM];
+static bool peer_used[ESP_NOW_MAX_TOTAL_PEER_NUM];
+static size_t fetch_index = 0;
+static std::deque<pending_send_t> send_queue;
+
+//-----------------------------------------------------------------------------
+static int find_peer(const uint8_t *peer_addr){
+  for(int i = 0; i < ESP_NOW_MAX_TOTAL_PEER_NUM; i++){
+    if(peer_used[i] && memcmp(peers[i].peer_addr, peer_addr, ESP_NOW_ETH_ALEN) == 0){
+      return(i);
+    }
+  }
+  return(-1);
+}
+
+//-----------------------------------------------------------------------------
+static int count_encrypted(){
+  int count = 0;
+  for(int i = 0; i < ESP_NOW_MAX_TOTAL_PEER_NUM; i++){
+    if(peer_used[i] && peers[i].encrypt){
+      count++;
+    }
+  }
+  return(count);
+}
+
+//-----------------------------------------------------------------------------
+static void queue_send(const uint8_t *peer_addr, const uint8_t *data, size_t len){
+  pending_send_t pending;
+  memcpy(pending.mac, peer_addr, ESP_NOW_ETH_ALEN);
+  pending.status = ESP_NOW_SEND_SUCCESS;
+  memcpy(pending.data, data, len);
+  pending.len = len;
+  send_queue.push_back(pending);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_init(){
+  if(WiFi.getMode() == WIFI_MODE_NULL){
+    return(ESP_ERR_WIFI_NOT_INIT);
+  }
+  espnow_ready = true;
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_deinit(){
+  espnow_ready = false;
+  memset(peer_used, 0, sizeof(peer_used));
+  send_queue.clear();
+  fetch_index = 0;
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_get_version(uint32_t *version){
+  if(version == NULL){
+    return(ESP_ERR_ESPNOW_ARG);
+  }
+  *version = 1;
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_register_recv_cb(esp_now_recv_cb_t cb){
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  recv_cb = cb;
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_unregister_recv_cb(){
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  recv_cb = NULL;
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_register_send_cb(esp_now_send_cb_t cb){
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  send_cb = cb;
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_unregister_send_cb(){
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  send_cb = NULL;
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+// A NULL address sends to every peer in the table
+esp_err_t esp_now_send(const uint8_t *peer_addr, const uint8_t *data, size_t len){
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  if(data == NULL || len == 0 || len > ESP_NOW_MAX_DATA_LEN){
+    return(ESP_ERR_ESPNOW_ARG);
+  }
+  if(peer_addr == NULL){
+    for(int i = 0; i < ESP_NOW_MAX_TOTAL_PEER_NUM; i++){
+      if(peer_used[i]){
+        queue_send(peers[i].peer_addr, data, len);
+      }
+    }
+    return(ESP_OK);
+  }
+  if(find_peer(peer_addr) < 0){
+    return(ESP_ERR_ESPNOW_NOT_FOUND);
+  }
+  queue_send(peer_addr, data, len);
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_add_peer(const esp_now_peer_info_t *peer){
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  if(peer == NULL || peer->channel > 14){
+    return(ESP_ERR_ESPNOW_ARG);
+  }
+  if(find_peer(peer->peer_addr) >= 0){
+    return(ESP_ERR_ESPNOW_EXIST);
+  }
+  if(peer->encrypt && count_encrypted() >= ESP_NOW_MAX_ENCRYPT_PEER_NUM){
+    return(ESP_ERR_ESPNOW_FULL);
+  }
+  for(int i = 0; i < ESP_NOW_MAX_TOTAL_PEER_NUM; i++){
+    if(!peer_used[i]){
+      peers[i] = *peer;
+      peer_used[i] = true;
+      return(ESP_OK);
+    }
+  }
+  return(ESP_ERR_ESPNOW_FULL);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_del_peer(const uint8_t *peer_addr){
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  if(peer_addr == NULL){
+    return(ESP_ERR_ESPNOW_ARG);
+  }
+  int index = find_peer(peer_addr);
+  if(index < 0){
+    return(ESP_ERR_ESPNOW_NOT_FOUND);
+  }
+  peer_used[index] = false;
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_mod_peer(const esp_now_peer_info_t *peer){
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  if(peer == NULL || peer->channel > 14){
+    return(ESP_ERR_ESPNOW_ARG);
+  }
+  int index = find_peer(peer->peer_addr);
+  if(index < 0){
+    return(ESP_ERR_ESPNOW_NOT_FOUND);
+  }
+  peers[index] = *peer;
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_get_peer(const uint8_t *peer_addr, esp_now_peer_info_t *peer){
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  if(peer_addr == NULL || peer == NULL){
+    return(ESP_ERR_ESPNOW_ARG);
+  }
+  int index = find_peer(peer_addr);
+  if(index < 0){
+    return(ESP_ERR_ESPNOW_NOT_FOUND);
+  }
+  *peer = peers[index];
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_fetch_peer(bool from_head, esp_now_peer_info_t *peer){
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  if(peer == NULL){
+    return(ESP_ERR_ESPNOW_ARG);
+  }
+  if(from_head){
+    fetch_index = 0;
+  }
+  for(; fetch_index < ESP_NOW_MAX_TOTAL_PEER_NUM; fetch_index++){
+    if(peer_used[fetch_index]){
+      *peer = peers[fetch_index++];
+      return(ESP_OK);
+    }
+  }
+  return(ESP_ERR_ESPNOW_NOT_FOUND);
+}
+
+//-----------------------------------------------------------------------------
+bool esp_now_is_peer_exist(const uint8_t *peer_addr){
+  return(espnow_ready && peer_addr != NULL && find_peer(peer_addr) >= 0);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_get_peer_num(esp_now_peer_num_t *num){
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  if(num == NULL){
+    return(ESP_ERR_ESPNOW_ARG);
+  }
+  num->total_num = 0;
+  for(int i = 0; i < ESP_NOW_MAX_TOTAL_PEER_NUM; i++){
+    num->total_num += peer_used[i];
+  }
+  num->encrypt_num = count_encrypted();
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_set_pmk(const uint8_t *pmk){
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  if(pmk == NULL){
+    return(ESP_ERR_ESPNOW_ARG);
+  }
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_now_set_wake_window(uint16_t window){
+  (void)window;
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+// Deliver queued send results, as the WiFi task would on the chip, and loop
+// packets sent to our own MAC back in as received packets
+void esp_now_native_task(){
+  while(!send_queue.empty()){
+    pending_send_t pending = send_queue.front();
+    send_queue.pop_front();
+    if(send_cb){
+      send_cb(pending.mac, pending.status);
+    }
+    if(recv_cb && memcmp(pending.mac, native_mac, ESP_NOW_ETH_ALEN) == 0){
+      recv_cb(native_mac, pending.data, pending.len);
+    }
+  }
+}
+
+//-----------------------------------------------------------------------------
+bool esp_now_native_pending(){
+  return(!send_queue.empty());
+}
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_wifi_config_espnow_rate(wifi_interface_t ifx, wifi_phy_rate_t rate){
+  if(ifx != WIFI_IF_STA && ifx != WIFI_IF_AP){
+    return(ESP_ERR_INVALID_ARG);
+  }
+  if(rate >= WIFI_PHY_RATE_MAX){
+    return(ESP_ERR_INVALID_ARG);
+  }
+  if(!espnow_ready){
+    return(ESP_ERR_ESPNOW_NOT_INIT);
+  }
+  return(ESP_OK);
+}
+
+//-----------------------------------------------------------------------------
+const char *esp_err_to_name(esp_err_t code){
+  switch(code){
+    case ESP_OK: return("ESP_OK");
+    case ESP_FAIL: return("ESP_FAIL");
+    case ESP_ERR_INVALID_ARG: return("ESP_ERR_INVALID_ARG");
+    case ESP_ERR_WIFI_NOT_INIT: return("ESP_ERR_WIFI_NOT_INIT");
+    case ESP_ERR_ESPNOW_NOT_INIT: return("ESP_ERR_ESPNOW_NOT_INIT");
+    case ESP_ERR_ESPNOW_ARG: return("ESP_ERR_ESPNOW_ARG");
+    case ESP_ERR_ESPNOW_NO_MEM: return("ESP_ERR_ESPNOW_NO_MEM");
+    case ESP_ERR_ESPNOW_FULL: return("ESP_ERR_ESPNOW_FULL");
+    case ESP_ERR_ESPNOW_NOT_FOUND: return("ESP_ERR_ESPNOW_NOT_FOUND");
+    case ESP_ERR_ESPNOW_INTERNAL: return("ESP_ERR_ESPNOW_INTERNAL");
+    case ESP_ERR_ESPNOW_EXIST: return("ESP_ERR_ESPNOW_EXIST");
+    case ESP_ERR_ESPNOW_IF: return("ESP_ERR_ESPNOW_IF");
+    default: return("UNKNOWN ERROR");
+  }
+}
+
+//-----------------------------------------------------------------------------
+bool WiFiClass::mode(wifi_mode_t mode){
+  current_mode = mode;
+  return(true);
+}
+
+//-----------------------------------------------------------------------------
+wifi_mode_t WiFiClass::getMode(){
+  return(current_mode);
+}
+
+//-----------------------------------------------------------------------------
+uint8_t *WiFiClass::macAddress(uint8_t *mac){
+  memcpy(mac, native_mac, ESP_NOW_ETH_ALEN);
+  return(mac);
+}
@@ -0,0 +1,45 @@
+//-----------------------------------------------------------------------------
+// File: esp_wifi.h
+// Last modified: 19/10/2026
+// Host stand-in for the ESP-IDF WiFi types, used by the native build only.
+//-----------------------------------------------------------------------------
+#ifndef ESP_WIFI_H
+#define ESP_WIFI_H
+#include <cstdint>
+
+//-----------------------------------------------------------------------------
+typedef int esp_err_t;
+
+#define ESP_OK 0
+#define ESP_FAIL -1
+#define ESP_ERR_INVALID_ARG 0x102
+#define ESP_ERR_WIFI_BASE 0x3000
+#define ESP_ERR_WIFI_NOT_INIT (ESP_ERR_WIFI_BASE + 1)
+
+//-----------------------------------------------------------------------------
+typedef enum{
+    WIFI_MODE_NULL,
+    WIFI_MODE_STA,
+    WIFI_MODE_AP,
+    WIFI_MODE_APSTA,
+} wifi_mode_t;
+
+typedef enum{
+    WIFI_IF_STA,
+    WIFI_IF_AP,
+} wifi_interface_t;
+
+typedef enum{
+    WIFI_PHY_RATE_1M_L = 0x00,
+    WIFI_PHY_RATE_54M = 0x0C,
+    WIFI_PHY_RATE_MCS7_SGI = 0x1F,
+    WIFI_PHY_RATE_LORA_250K = 0x29,
+    WIFI_PHY_RATE_LORA_500K = 0x2A,
+    WIFI_PHY_RATE_MAX,
+} wifi_phy_rate_t;
+
+//-----------------------------------------------------------------------------
+esp_err_t esp_wifi_config_espnow_rate(wifi_interface_t ifx, wifi_phy_rate_t rate);
+const char *esp_err_to_name(esp_err_t code);
+
+#endif
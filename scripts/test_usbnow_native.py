@@ -0,0 +1,78 @@
+import os
+import threading
+import pytest
+
+pytest.importorskip("serial")
+from usbnow import USBNow, MAC, CMD, SLIP_END
+
+# Set USBNOW_PORT to run the tests against a real adapter instead of the native build
+REAL_PORT = os.environ.get("USBNOW_PORT")
+BROADCAST = MAC("FF:FF:FF:FF:FF:FF")
+
+#------------------------------------------------------------------------------
+def open_usbnow(port: str):
+    usbnow = USBNow(port)
+    try:
+        yield usbnow
+        usbnow.deinit()
+    finally:
+        usbnow.serial_thread.close()
+        usbnow.close()
+
+@pytest.fixture
+def usbnow():
+    if(REAL_PORT):
+        yield from open_usbnow(REAL_PORT)
+        return
+    # The native adapter runs behind a pseudo terminal, which Windows doesn't have
+    pytest.importorskip("termios")
+    from usbnow_native import NativeAdapter, DEFAULT_PROGRAM
+    program = os.environ.get("USBNOW_NATIVE_PROGRAM", DEFAULT_PROGRAM)
+    if(not os.path.isfile(program)):
+        pytest.skip(f"Native firmware not built: {program}")
+    with NativeAdapter(program) as adapter:
+        yield from open_usbnow(adapter.port)
+
+#------------------------------------------------------------------------------
+def test_round_trip(usbnow: USBNow):
+    assert usbnow.init() is None
+    assert usbnow.add_peer(BROADCAST) is None
+    assert usbnow.send(BROADCAST, b"Hello, World!") is None
+    assert isinstance(usbnow.get_mac(), MAC)
+
+def test_bad_length(usbnow: USBNow):
+    assert usbnow.init() is None
+    usbnow.send_slip_bytes(bytes([CMD.SEND, 0x01, 0x02]))
+    assert usbnow.wait_ok() == "Invalid Length"
+    assert usbnow.add_peer(BROADCAST) is None
+
+def test_recover_after_lost_response(usbnow: USBNow):
+    assert usbnow.init() is None
+    # A command whose response never arrives
+    usbnow.send_count += 1
+    usbnow.wait_count = usbnow.send_count
+    assert usbnow.wait_ok() == "timeout"
+    for i in range(3):
+        assert usbnow.add_peer(MAC([0x02, 0, 0, 0, 0, 0x10 + i])) is None
+
+def test_short_package_dropped(usbnow: USBNow):
+    # Packages shorter than their checksum must be dropped without upsetting the parser
+    for junk in (bytes([SLIP_END]), bytes([0x01, SLIP_END])):
+        usbnow.serial.write(junk)
+        usbnow.receive_buffer.clear()
+        assert isinstance(usbnow.get_mac(), MAC)
+
+@pytest.mark.skipif(REAL_PORT is not None, reason="loopback is only emulated by the native build")
+def test_receive_loopback(usbnow: USBNow):
+    received = []
+    done = threading.Event()
+    def recv_cb(mac: bytes, data: bytes):
+        received.append((bytes(mac), bytes(data)))
+        done.set()
+    assert usbnow.init() is None
+    usbnow.register_recv_cb(recv_cb)
+    mac = usbnow.get_mac()
+    assert usbnow.add_peer(mac) is None
+    assert usbnow.send(mac, b"loopback") is None
+    assert done.wait(1)
+    assert received == [(bytes(mac), b"loopback")]
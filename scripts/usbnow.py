@@ -124,6 +124,7 @@ class USBNow(Protocol):
         #...
         self.send_count: int = 0
         self.resp_ok_count: int = 0
+        self.wait_count: int = 0
     
     def __exit__(self, exc_type, exc_value, traceback):
         self.close()
@@ -153,6 +154,7 @@ class USBNow(Protocol):
     def send_slip_bytes(self, data: bytes):
         self.serial_com_lock.acquire()
         self.send_count += 1
+        self.wait_count = self.send_count
         checksum = 0
         for byte in data:
             self.send_slip_byte(byte)
@@ -177,9 +179,13 @@ class USBNow(Protocol):
     def wait_ok(self) -> str|None:
         #res = self.OK_resp_lock.acquire(timeout=self.timeout)
         #print("waiting for OK")
+        # Count responses so an OK that arrives before we start waiting is not lost
         with self.OK_resp_lock:
-            res = self.OK_resp_lock.wait(self.timeout)
+            wait_count = self.wait_count
+            res = self.OK_resp_lock.wait_for(lambda: self.resp_ok_count >= wait_count, self.timeout)
             if(res == False):
+                # The response was lost, don't let it hold back the next commands
+                self.resp_ok_count = self.send_count
                 return("timeout")
         if(self.print_error and self.error_resp):
             print("Error:", self.error_resp)
@@ -210,24 +216,27 @@ class USBNow(Protocol):
             if(self.send_cb):
                 self.send_cb(data[1:7], ["OK", "ERROR"][data[7]])
         elif(data[0] == RESP.ERROR):
-            with self.OK_resp_lock:
-                self.error_resp = data[1:].decode()
-                self.OK_resp_lock.notify()
-                #self.OK_resp_lock.release()
+            self.complete_resp(data[1:].decode())
         elif(data[0] == RESP.ERROR_LEN):
-            raise Exception("USBNow Error: Invalid Length")
+            # The device answers a bad length with this package only, no OK/ERROR follows
+            self.complete_resp("Invalid Length")
         elif(data[0] == RESP.ERROR_UNKNOWN):
             raise Exception("USBNow Error: Unknown Command")
         elif(data[0] == RESP.OK):
-            with self.OK_resp_lock:
-                self.error_resp = None
-                self.OK_resp_lock.notify()
-                #self.OK_resp_lock.release()
+            self.complete_resp(None)
         else:
             self.receive_buffer.append(data)
             if(len(self.receive_buffer) > 10):
                 self.receive_buffer.pop(0)
 
+    # Mark the oldest command as answered and wake up wait_ok
+    def complete_resp(self, error: str|None) -> None:
+        with self.OK_resp_lock:
+            self.error_resp = error
+            # A late response to a command that already timed out must not count for the next one
+            self.resp_ok_count = min(self.resp_ok_count + 1, self.send_count)
+            self.OK_resp_lock.notify()
+
     #------------------------------------------------------------------------------
     # USBNow API
     #------------------------------------------------------------------------------
@@ -0,0 +1,254 @@
+import os
+import sys
+import time
+import random
+import struct
+import argparse
+import subprocess
+import threading
+import serial
+from usbnow import USBNow, MAC, SLIP, CMD, RESP
+
+# Program built by `pio run -e native`
+DEFAULT_PROGRAM = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".pio", "build", "native", "program")
+
+#------------------------------------------------------------------------------
+class NativeAdapter:
+    """Host build of the USB-Now firmware running behind a pseudo terminal.
+    The native program talks SLIP over stdin/stdout. This class connects it to
+    a pseudo terminal, so anything that takes a serial port name (USBNow,
+    usbnow-monitor.py) can use the emulated adapter instead of a real one.
+    Args:
+        program (str): Path of the native firmware program
+    Properties:
+        port (str): Serial port name of the emulated adapter
+    """
+    def __init__(self, program: str = DEFAULT_PROGRAM):
+        self.program: str = program
+        self.port: str = None
+        self.process: subprocess.Popen = None
+        self.slave_fd: int = None
+
+    def __enter__(self):
+        self.start()
+        return(self)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    # Start the firmware and return the serial port name
+    def start(self) -> str:
+        # Pseudo terminals are Unix only, keep the module importable on Windows
+        import tty
+        if(not os.path.isfile(self.program)):
+            raise FileNotFoundError(f"Native firmware not found: {self.program} (run `pio run -e native`)")
+        master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.slave_fd)
+        self.process = subprocess.Popen([self.program], stdin=master_fd, stdout=master_fd)
+        os.close(master_fd)
+        self.port = os.ttyname(self.slave_fd)
+        return(self.port)
+
+    # Stop the firmware and release the pseudo terminal
+    def stop(self) -> None:
+        if(self.process):
+            if(self.process.poll() is None):
+                self.process.terminate()
+            self.process.wait()
+            self.process = None
+        if(self.slave_fd is not None):
+            os.close(self.slave_fd)
+            self.slave_fd = None
+
+    def is_alive(self) -> bool:
+        return(self.process is not None and self.process.poll() is None)
+
+#------------------------------------------------------------------------------
+# Encode a package the same way USBNow.send_slip_bytes does
+def slip_encode(data: bytes) -> bytes:
+    checksum = struct.pack("I", sum(byte + 1 for byte in data) % 2**32)
+    frame = bytearray()
+    for byte in data + checksum:
+        if(byte == SLIP.END):
+            frame += bytes([SLIP.ESC, SLIP.ESC_END])
+        elif(byte == SLIP.ESC):
+            frame += bytes([SLIP.ESC, SLIP.ESC_ESC])
+        else:
+            frame.append(byte)
+    frame.append(SLIP.END)
+    return(bytes(frame))
+
+#------------------------------------------------------------------------------
+# Measure command round trips through the USBNow module
+def bench(port: str, count: int, size: int) -> None:
+    usbnow = USBNow(port)
+    try:
+        err = usbnow.init()
+        if(err):
+            print("USBNow has error: ", err)
+            return
+        addr = MAC("FF:FF:FF:FF:FF:FF")
+        usbnow.add_peer(addr)
+        payload = bytes(size)
+        sent = 0
+        start = time.perf_counter()
+        for i in range(count):
+            err = usbnow.send(addr, payload)
+            if(err):
+                print("Send failed:", err)
+                break
+            sent += 1
+        elapsed = time.perf_counter() - start
+        count = sent
+        print(f"{count} sends of {size} bytes in {elapsed:.3f}s")
+        print(f"Send Per Second: {count/elapsed:.1f}")
+        print(f"Payload Bytes Per Second: {count*size/elapsed:.1f}")
+        usbnow.deinit()
+    finally:
+        close_usbnow(usbnow)
+
+# Measure packets coming back from the adapter through the receive callback.
+# The native adapter loops sends to its own MAC back as received packets, so
+# the sends are pipelined and only the RESP_RECV_CB packages are timed.
+def bench_recv(port: str, count: int, size: int) -> None:
+    usbnow = USBNow(port)
+    try:
+        err = usbnow.init()
+        if(err):
+            print("USBNow has error: ", err)
+            return
+        addr = usbnow.get_mac()
+        usbnow.add_peer(addr)
+        received = 0
+        done = threading.Event()
+        def recv_cb(mac: bytes, data: bytes):
+            nonlocal received
+            received += 1
+            if(received == count):
+                done.set()
+        usbnow.register_recv_cb(recv_cb)
+        payload = bytes(size)
+        usbnow.wait_resp = False
+        start = time.perf_counter()
+        for i in range(count):
+            usbnow.send(addr, payload)
+        if(not done.wait(10 + count / 100)):
+            print(f"Only {received} of {count} packets received")
+        elapsed = time.perf_counter() - start
+        count = received
+        print(f"{count} received packets of {size} bytes in {elapsed:.3f}s")
+        print(f"Receive Per Second: {count/elapsed:.1f}")
+        print(f"Payload Bytes Per Second: {count*size/elapsed:.1f}")
+        usbnow.wait_resp = True
+        usbnow.deinit()
+    finally:
+        close_usbnow(usbnow)
+
+# Stop the reader thread before the port goes away under it
+def close_usbnow(usbnow: USBNow) -> None:
+    usbnow.serial_thread.close()
+    usbnow.close()
+
+#------------------------------------------------------------------------------
+# Make a random input for the frame parser
+def fuzz_input(rng: random.Random) -> bytes:
+    kind = rng.randrange(4)
+    if(kind == 0):
+        # Valid frame, random command and payload
+        return(slip_encode(bytes([rng.randrange(16)]) + rng.randbytes(rng.randrange(300))))
+    if(kind == 1):
+        # Valid frame with a corrupted byte
+        frame = bytearray(slip_encode(bytes([rng.randrange(16)]) + rng.randbytes(rng.randrange(32))))
+        frame[rng.randrange(len(frame))] = rng.randrange(256)
+        return(bytes(frame))
+    if(kind == 2):
+        # Control bytes only
+        return(bytes(rng.choice([SLIP.END, SLIP.ESC, SLIP.ESC_END, SLIP.ESC_ESC]) for _ in range(rng.randrange(1, 16))))
+    # Random bytes
+    return(rng.randbytes(rng.randrange(1, 3000)))
+
+# Ask for the MAC address until the adapter answers, every frame written is added to log
+def probe(device: serial.Serial, log: bytearray, retries: int = 3) -> bool:
+    decoder = SLIP()
+    for _ in range(retries):
+        frame = slip_encode(bytes([CMD.GET_MAC]))
+        log += frame
+        device.write(frame)
+        deadline = time.monotonic() + 0.5
+        while(time.monotonic() < deadline):
+            for byte in device.read(device.in_waiting or 1):
+                decoder.push(byte)
+            while(decoder.in_wait() > 0):
+                if(decoder.get()[:1] == bytes([RESP.PEER_ADDR])):
+                    return(True)
+    return(False)
+
+# Feed random inputs to the adapter and check it still answers after each batch.
+# Parser and peer state carry over between batches, so on failure everything
+# written since the adapter started goes to crash_file for replay.
+def fuzz(adapter: NativeAdapter, iterations: int, batch: int, seed: int, crash_file: str) -> bool:
+    import termios
+    rng = random.Random(seed)
+    device = serial.Serial(adapter.port, timeout=0.05)
+    sent = bytearray()
+    for i in range(0, iterations, batch):
+        batch_end = min(i + batch, iterations)
+        try:
+            for _ in range(i, batch_end):
+                data = fuzz_input(rng)
+                sent += data
+                device.write(data)
+                device.reset_input_buffer()
+            alive = probe(device, sent)
+        except (serial.SerialException, termios.error, OSError):
+            # The pseudo terminal reports an I/O error once the adapter exits
+            alive = False
+        if(not alive or not adapter.is_alive()):
+            with open(crash_file, "wb") as f:
+                f.write(sent)
+            print(f"Adapter stopped responding during inputs {i}-{batch_end - 1} (seed {seed})")
+            print(f"All {len(sent)} bytes written since start saved to {crash_file}")
+            device.close()
+            return(False)
+    print(f"{iterations} inputs, adapter still responding (seed {seed})")
+    device.close()
+    return(True)
+
+#------------------------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Run the native USB-Now firmware")
+    parser.add_argument("-p", "--program", help="Native firmware program", default=DEFAULT_PROGRAM)
+    subparsers = parser.add_subparsers(dest="mode")
+    subparsers.add_parser("serve", help="Print the port name and run until Enter is pressed")
+    bench_parser = subparsers.add_parser("bench", help="Measure send round trips or receive throughput")
+    bench_parser.add_argument("-r", "--recv", help="Measure packets received from the adapter", action="store_true")
+    bench_parser.add_argument("-n", "--count", help="Number of sends, Default: 1000", type=int, default=1000)
+    bench_parser.add_argument("-s", "--size", help="Payload size, Default: 100", type=int, default=100)
+    fuzz_parser = subparsers.add_parser("fuzz", help="Feed random inputs to the frame parser")
+    fuzz_parser.add_argument("-n", "--iterations", help="Number of inputs, Default: 10000", type=int, default=10000)
+    fuzz_parser.add_argument("-b", "--batch", help="Inputs between liveness checks, Default: 100", type=int, default=100)
+    fuzz_parser.add_argument("--seed", help="Random seed", type=int, default=None)
+    fuzz_parser.add_argument("--crash-file", help="Where to save the input that stopped the adapter", default="crash.bin")
+    args = parser.parse_args()
+
+    if(not args.mode):
+        parser.print_help()
+        sys.exit(0)
+
+    with NativeAdapter(args.program) as adapter:
+        if(args.mode == "serve"):
+            print("Port:", adapter.port)
+            input("Press Enter to exit\n")
+        elif(args.mode == "bench"):
+            if(args.recv):
+                bench_recv(adapter.port, args.count, args.size)
+            else:
+                bench(adapter.port, args.count, args.size)
+        elif(args.mode == "fuzz"):
+            seed = args.seed if args.seed is not None else random.randrange(2**32)
+            if(not fuzz(adapter, args.iterations, args.batch, seed, args.crash_file)):
+                sys.exit(1)
+
+
+if(__name__ == "__main__"):
+    main()
@@ -40,11 +40,13 @@ uint8_t slip_is_ready(uint8_t *buffer);
     void slip_init(uint8_t *buffer, uint32_t size, uint8_t checksum_enable){
         slip_buffer_header_t slip_buffer_header;
         slip_buffer_header.len = 0;
-        slip_buffer_header.size = size;
+        // size covers the whole buffer, the header takes the front of it
+        slip_buffer_header.size = size - sizeof(slip_buffer_header_t);
         slip_buffer_header.checksum = 0;
         slip_buffer_header.ready = false;
         slip_buffer_header.esc_flag = false;
         slip_buffer_header.checksum_enable = checksum_enable;
+        slip_buffer_header.overflow = false;
         memcpy(buffer, &slip_buffer_header, sizeof(slip_buffer_header_t));   
     }
 
@@ -74,6 +76,13 @@ uint8_t slip_is_ready(uint8_t *buffer);
             slip_buffer_header->esc_flag = true;
         }
         else if(data == S_END){
+            if(slip_buffer_header->checksum_enable == true){
+                // Too short to hold the checksum, drop the package
+                if(slip_buffer_header->len < 4){
+                    slip_reset(buffer);
+                    return;
+                }
+            }
             slip_buffer_header->ready = true;
             if(slip_buffer_header->checksum_enable == true){
                 for(uint8_t i = 0; i < 4; i++){
@@ -103,11 +112,13 @@ uint8_t slip_is_ready(uint8_t *buffer);
         uint8_t *data_buffer = buffer + sizeof(slip_buffer_header_t);
         if(slip_buffer_header->ready){
             if(slip_buffer_header->checksum_enable == true){
-                uint32_t *rx_checksum = (uint32_t *)(data_buffer + slip_buffer_header->len);
+                // The checksum can sit at any offset, copy it out instead of casting
+                uint32_t rx_checksum;
+                memcpy(&rx_checksum, data_buffer + slip_buffer_header->len, sizeof(rx_checksum));
                 //Serial.print("checksum: ");
                 //Serial.println(slip_buffer_header->checksum);
-                //Serial.println(*rx_checksum);
-                if(slip_buffer_header->checksum == *rx_checksum){
+                //Serial.println(rx_checksum);
+                if(slip_buffer_header->checksum == rx_checksum){
                     return(true);
                 }else{
                     slip_reset(buffer);